@@ -0,0 +1 @@
+"""FashionBench evaluation scripts."""
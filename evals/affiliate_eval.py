@@ -5,31 +5,52 @@ This script evaluates an LLM's ability to detect affiliate marketing, sponsored
 discount codes, and monetization strategies in fashion social media posts.
 """
 
-import jsonlines
-import sys
-from pathlib import Path
-import json
+import ahocorasick
+import re
+from dataclasses import dataclass, asdict
+from typing import List, Optional
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
 from scoring.metrics import exact_match
-
-
-def load_dataset(dataset_path: str) -> list:
-    """
-    Load the affiliate detection dataset from JSONL file.
-
-    Args:
-        dataset_path: Path to the JSONL dataset file
-
-    Returns:
-        List of dataset examples
-    """
-    examples = []
-    with jsonlines.open(dataset_path) as reader:
-        for obj in reader:
-            examples.append(obj)
-    return examples
+from evals.engine import DATASETS_DIR, EvalSpec, load_dataset, run_eval
+
+# Keyword signals scanned for in every post
+_SPONSORED_KEYWORDS = ("#ad", "#gifted", "#sponsored", "paid partnership", "partnering")
+_AFFILIATE_KEYWORDS = (
+    "ltk", "liketoknow", "shop.ltk", "amazon", "storefront", "finds",
+    *_SPONSORED_KEYWORDS, "partnership",
+    "thrifted", "no links", "just sharing", "link", "swipe up", "tap to shop",
+)
+
+# All keyword signals fused into one automaton, scanned once per post;
+# overlapping hits ("shop.ltk" and "ltk", "no links" and "link") are all reported
+_AFFILIATE_AUTOMATON = ahocorasick.Automaton()
+for _keyword in _AFFILIATE_KEYWORDS:
+    _AFFILIATE_AUTOMATON.add_word(_keyword, _keyword)
+_AFFILIATE_AUTOMATON.make_automaton()
+
+# Precompiled patterns shared across every example
+# Discount codes are matched on the original text (only the "code" prefix is
+# case-insensitive): lower() can change a string's length ("İ" becomes two
+# characters), so offsets from the lowered text don't map back onto it
+_CODE_RE = re.compile(r'(?i:code)\s+(\w+)')
+_DISCOUNT_RE = re.compile(r'(\d+)%')
+
+
+@dataclass
+class AffiliateResult:
+    """Affiliate detection result; optional fields stay None until detected."""
+
+    has_affiliate: bool = False
+    platform: Optional[str] = None
+    type: Optional[str] = None
+    code: Optional[str] = None
+    discount: Optional[str] = None
+    disclosures: Optional[List[str]] = None
+    indicators: Optional[List[str]] = None
+
+    def to_dict(self) -> dict:
+        """Return the result as a dict containing only the detected fields."""
+        return {key: value for key, value in asdict(self).items() if value is not None}
 
 
 def detect_affiliate_content(text: str) -> dict:
@@ -43,63 +64,64 @@ def detect_affiliate_content(text: str) -> dict:
     Returns:
         Dictionary with affiliate detection results
     """
-    result = {"has_affiliate": False}
+    result = AffiliateResult()
     text_lower = text.lower()
 
+    # Single pass collecting every keyword signal present in the post
+    found = {keyword for _, keyword in _AFFILIATE_AUTOMATON.iter(text_lower)}
+
     # Detect affiliate platforms
-    if "ltk" in text_lower or "liketoknow" in text_lower:
-        result["has_affiliate"] = True
-        result["platform"] = "LTK"
-        if "shop.ltk" in text_lower:
-            result["platform"] = "ShopLTK"
+    if "ltk" in found or "liketoknow" in found:
+        result.has_affiliate = True
+        result.platform = "LTK"
+        if "shop.ltk" in found:
+            result.platform = "ShopLTK"
 
     # Detect Amazon affiliate
-    if "amazon" in text_lower and ("storefront" in text_lower or "finds" in text_lower):
-        result["has_affiliate"] = True
-        result["platform"] = "Amazon"
-        result["type"] = "affiliate_storefront"
+    if "amazon" in found and ("storefront" in found or "finds" in found):
+        result.has_affiliate = True
+        result.platform = "Amazon"
+        result.type = "affiliate_storefront"
 
     # Detect discount codes
-    import re
-    code_pattern = r'code\s+(\w+)'
-    codes = re.findall(code_pattern, text, re.IGNORECASE)
-    if codes:
-        result["has_affiliate"] = True
-        result["type"] = "discount_code" if not result.get("type") else result["type"]
-        result["code"] = codes[0]
+    # Matched on the original text, so the code keeps its casing
+    code_match = _CODE_RE.search(text)
+    if code_match:
+        result.has_affiliate = True
+        if not result.type:
+            result.type = "discount_code"
+        result.code = code_match.group(1)
 
         # Try to detect discount percentage
-        discount_pattern = r'(\d+)%'
-        discounts = re.findall(discount_pattern, text)
-        if discounts:
-            result["discount"] = f"{discounts[0]}%"
-
-    # Detect sponsored content
-    sponsored_keywords = ["#ad", "#gifted", "#sponsored", "paid partnership", "partnering"]
-    found_disclosures = [kw for kw in sponsored_keywords if kw in text_lower]
-    if found_disclosures:
-        result["has_affiliate"] = True
-        result["type"] = "sponsored"
-        result["disclosures"] = found_disclosures
+        discount_match = _DISCOUNT_RE.search(text_lower)
+        if discount_match:
+            result.discount = f"{discount_match.group(1)}%"
+
+    # Detect sponsored content (the disclosure list is only built when needed)
+    if not found.isdisjoint(_SPONSORED_KEYWORDS):
+        result.has_affiliate = True
+        result.type = "sponsored"
+        result.disclosures = [kw for kw in _SPONSORED_KEYWORDS if kw in found]
 
     # Detect brand partnerships
-    if "partnering" in text_lower or "partnership" in text_lower:
-        result["type"] = "brand_partnership" if result.get("has_affiliate") else result.get("type")
+    if "partnering" in found or "partnership" in found:
+        if result.has_affiliate:
+            result.type = "brand_partnership"
 
     # Check for organic content indicators
-    if not result["has_affiliate"]:
-        if "thrifted" in text_lower or "no links" in text_lower or "just sharing" in text_lower:
-            result["type"] = "organic"
+    if not result.has_affiliate:
+        if "thrifted" in found or "no links" in found or "just sharing" in found:
+            result.type = "organic"
 
     # Detect link mentions
-    if "link" in text_lower or "swipe up" in text_lower or "tap to shop" in text_lower:
-        result["has_affiliate"] = True
-        if "indicators" not in result:
-            result["indicators"] = []
-        if "link" in text_lower:
-            result["indicators"].append("link in bio")
+    if "link" in found or "swipe up" in found or "tap to shop" in found:
+        result.has_affiliate = True
+        if result.indicators is None:
+            result.indicators = []
+        if "link" in found:
+            result.indicators.append("link in bio")
 
-    return result
+    return result.to_dict()
 
 
 def simulate_model_response(example: dict, model_name: str) -> dict:
@@ -150,9 +172,10 @@ def calculate_affiliate_score(predicted: dict, expected: dict) -> float:
     # Check type
     if "type" in expected:
         components += 1
-        if predicted.get("type", "").lower() == expected["type"].lower():
+        predicted_type = predicted.get("type", "")
+        if predicted_type.lower() == expected["type"].lower():
             score += 1.0
-        elif expected["type"] in str(predicted.get("type", "")):
+        elif expected["type"] in str(predicted_type):
             score += 0.5
 
     # Check discount code
@@ -179,69 +202,32 @@ def calculate_affiliate_score(predicted: dict, expected: dict) -> float:
     return score / components if components > 0 else 0.0
 
 
-def evaluate_affiliate_detection(model_name: str = "simulated", dataset_path: str = None) -> dict:
+_SPEC = EvalSpec(
+    name="Affiliate Detection",
+    dataset=DATASETS_DIR / "affiliate_detection.jsonl",
+    predict=simulate_model_response,
+    score=calculate_affiliate_score,
+    text_field="text",
+    preview_chars=60,
+    output_label="Detected"
+)
+
+
+def evaluate_affiliate_detection(model_name: str = "simulated", dataset_path: str = None, verbose: bool = False,
+                                 workers: int = None) -> dict:
     """
     Evaluate model performance on affiliate detection tasks.
 
     Args:
         model_name: Name of the model to evaluate
         dataset_path: Path to dataset file (optional)
+        verbose: Print the header, per-example results and summary (silent otherwise)
+        workers: Number of worker processes for scoring (optional)
 
     Returns:
         Dictionary containing evaluation results and metrics
     """
-    if dataset_path is None:
-        dataset_path = Path(__file__).parent.parent / "datasets" / "affiliate_detection.jsonl"
-
-    examples = load_dataset(str(dataset_path))
-    results = []
-    total_score = 0
-
-    print(f"\n{'='*60}")
-    print(f"Evaluating Affiliate Detection - Model: {model_name}")
-    print(f"{'='*60}\n")
-
-    for example in examples:
-        # Get model response
-        model_output = simulate_model_response(example, model_name)
-        expected = example["expected"]
-
-        # Calculate score
-        score = calculate_affiliate_score(model_output, expected)
-        total_score += score
-
-        results.append({
-            "id": example["id"],
-            "text": example["text"],
-            "expected": expected,
-            "model_output": model_output,
-            "score": score
-        })
-
-        # Print individual result
-        status = "✓" if score >= 0.7 else "✗"
-        print(f"{status} Example {example['id']}: {score:.2f}")
-        print(f"  Text: {example['text'][:60]}...")
-        print(f"  Expected: {json.dumps(expected, indent=2)}")
-        print(f"  Detected: {json.dumps(model_output, indent=2)}\n")
-
-    # Calculate overall metrics
-    avg_score = total_score / len(examples) if examples else 0
-    passed = sum(1 for r in results if r["score"] >= 0.7)
-
-    print(f"{'='*60}")
-    print(f"Results: {passed}/{len(examples)} passed (threshold: 0.7)")
-    print(f"Average Score: {avg_score:.3f}")
-    print(f"{'='*60}\n")
-
-    return {
-        "eval_name": "Affiliate Detection",
-        "model": model_name,
-        "total_examples": len(examples),
-        "passed": passed,
-        "avg_score": avg_score,
-        "results": results
-    }
+    return run_eval(_SPEC, model_name, dataset_path, verbose, workers)
 
 
 if __name__ == "__main__":
@@ -251,6 +237,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Evaluate affiliate detection capabilities")
     parser.add_argument("--model", default="simulated", help="Model name to evaluate")
     parser.add_argument("--dataset", default=None, help="Path to dataset file")
+    parser.add_argument("--quiet", action="store_true", help="Suppress progress and per-example output")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
 
     args = parser.parse_args()
-    evaluate_affiliate_detection(args.model, args.dataset)
+    evaluate_affiliate_detection(args.model, args.dataset, verbose=not args.quiet, workers=args.workers)
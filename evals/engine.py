@@ -0,0 +1,203 @@
+"""
+Evaluation Engine
+
+Shared driver loop for FashionBench evaluations. Each task describes itself
+with an EvalSpec; run_eval streams the dataset, runs the model, scores every
+example, prints progress and aggregates the metrics.
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Optional
+
+import orjson
+
+from evals.records import EvalRecord
+
+# Resolved once at import; task specs build their default dataset paths from it
+DATASETS_DIR = Path(__file__).resolve().parent.parent / "datasets"
+
+
+@dataclass
+class EvalSpec:
+    """
+    Task-specific pieces plugged into run_eval.
+
+    Attributes:
+        name: Display name of the evaluation
+        dataset: Default path to the JSONL dataset
+        predict: Called as predict(example, model_name), returns the model output
+        score: Called as score(model_output, expected), returns a score between 0 and 1
+        text_field: Example field stored as the record text and echoed in verbose output
+        context_field: Optional example field stored as the record context
+        preview_chars: Truncate the echoed text to this many characters (None keeps it whole)
+        output_label: Label for the model output in verbose output
+        threshold: Minimum score counted as a pass
+    """
+
+    name: str
+    dataset: Path
+    predict: Callable[[dict, str], Any]
+    score: Callable[[Any, Any], float]
+    text_field: str
+    context_field: Optional[str] = None
+    preview_chars: Optional[int] = None
+    output_label: str = "Predicted"
+    threshold: float = 0.7
+
+
+def load_dataset(dataset_path: str) -> Iterator[dict]:
+    """
+    Stream an evaluation dataset from JSONL file.
+
+    Args:
+        dataset_path: Path to the JSONL dataset file
+
+    Yields:
+        Dataset examples, one per line
+    """
+    with open(dataset_path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of a parsed JSON value: dicts become mappingproxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=16)
+def _load_frozen(dataset_path: str, mtime_ns: int, size: int) -> tuple:
+    """Parse a dataset once per (path, mtime, size); an edited file gets a fresh entry."""
+    return tuple(_freeze(orjson.loads(line)) for line in Path(dataset_path).read_bytes().splitlines() if line.strip())
+
+
+def load_dataset_cached(dataset_path: str) -> tuple:
+    """
+    Load an evaluation dataset from JSONL file, caching the parsed examples.
+
+    Repeated loads of the same unchanged file (by resolved path) skip the disk
+    read and JSON parse. The cached examples are shared, so they are handed
+    out frozen: dicts as read-only mappings, lists as tuples.
+
+    Args:
+        dataset_path: Path to the JSONL dataset file
+
+    Returns:
+        Tuple of read-only dataset examples
+    """
+    path = Path(dataset_path).resolve()
+    stat = path.stat()
+    return _load_frozen(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _score_example(spec: EvalSpec, model_name: str, example: dict) -> tuple:
+    """Run the model on one example and score it; module-level so worker processes can unpickle it."""
+    model_output = spec.predict(example, model_name)
+    return model_output, spec.score(model_output, example["expected"])
+
+
+def _format_value(value: Any) -> str:
+    """Render a value for verbose output, using compact JSON for dicts and lists."""
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value).decode()
+    return str(value)
+
+
+def run_eval(spec: EvalSpec, model_name: str = "simulated", dataset_path: str = None, verbose: bool = False,
+             workers: int = None) -> dict:
+    """
+    Evaluate a model on one task described by an EvalSpec.
+
+    Args:
+        spec: Task description
+        model_name: Name of the model to evaluate
+        dataset_path: Path to dataset file (optional, defaults to spec.dataset)
+        verbose: Print the header, per-example results and summary (silent otherwise)
+        workers: Fan examples out over this many processes (optional). Only pays off
+            for large datasets or slow models; the dataset is loaded up front.
+
+    Returns:
+        Dictionary containing evaluation results and metrics
+    """
+    if dataset_path is None:
+        dataset_path = spec.dataset
+
+    results = []
+    output_lines = []
+    total_score = 0
+    count = 0
+    passed = 0
+    text_label = spec.text_field.capitalize()
+
+    if verbose:
+        print(f"\n{'='*60}")
+        print(f"Evaluating {spec.name} - Model: {model_name}")
+        print(f"{'='*60}\n")
+
+    # Get model responses and scores, in-process or across worker processes
+    score_example = partial(_score_example, spec, model_name)
+    if workers is not None and workers > 1:
+        examples = list(load_dataset(str(dataset_path)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            scored = list(executor.map(score_example, examples, chunksize=64))
+        rows = zip(examples, scored)
+    else:
+        rows = ((example, score_example(example)) for example in load_dataset(str(dataset_path)))
+
+    for example, (model_output, score) in rows:
+        expected = example["expected"]
+        total_score += score
+        count += 1
+        if score >= spec.threshold:
+            passed += 1
+
+        results.append(EvalRecord(
+            id=example["id"],
+            text=example[spec.text_field],
+            expected=expected,
+            model_output=model_output,
+            score=score,
+            context=example[spec.context_field] if spec.context_field else None
+        ))
+
+        # Buffer individual result
+        if verbose:
+            status = "✓" if score >= spec.threshold else "✗"
+            text = example[spec.text_field]
+            if spec.preview_chars is not None:
+                text = f"{text[:spec.preview_chars]}..."
+            output_lines.append(f"{status} Example {example['id']}: {score:.2f}")
+            output_lines.append(f"  {text_label}: {text}")
+            output_lines.append(f"  Expected: {_format_value(expected)}")
+            output_lines.append(f"  {spec.output_label}: {_format_value(model_output)}\n")
+
+    if output_lines:
+        sys.stdout.write("\n".join(output_lines) + "\n")
+
+    # Calculate overall metrics
+    avg_score = total_score / count if count else 0
+
+    if verbose:
+        print(f"{'='*60}")
+        print(f"Results: {passed}/{count} passed (threshold: {spec.threshold})")
+        print(f"Average Score: {avg_score:.3f}")
+        print(f"{'='*60}\n")
+
+    return {
+        "eval_name": spec.name,
+        "model": model_name,
+        "total_examples": count,
+        "passed": passed,
+        "avg_score": avg_score,
+        "results": results
+    }
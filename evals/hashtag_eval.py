@@ -5,31 +5,68 @@ This script evaluates an LLM's ability to understand fashion-specific hashtags,
 their meanings, contexts, and purposes in social media content.
 """
 
-import jsonlines
-import sys
-from pathlib import Path
-import json
-
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
 from scoring.metrics import exact_match, partial_match
+from evals.engine import DATASETS_DIR, EvalSpec, load_dataset, run_eval
+
+# Hashtag knowledge base for demo
+_HASHTAG_DB = {
+    "#ootd": {
+        "meaning": "Outfit Of The Day",
+        "category": "outfit_sharing",
+        "purpose": "showcase daily outfit choice"
+    },
+    "#grwm": {
+        "meaning": "Get Ready With Me",
+        "category": "lifestyle_content",
+        "purpose": "document preparation routine"
+    },
+    "#tryonhaul": {
+        "meaning": "Try On Haul",
+        "category": "shopping_content",
+        "purpose": "show purchased items being worn"
+    },
+    "#iykyk": {
+        "meaning": "If You Know You Know",
+        "category": "insider_reference",
+        "purpose": "subtle flex or insider knowledge"
+    },
+    "#dupealert": {
+        "meaning": "Dupe Alert",
+        "category": "budget_fashion",
+        "purpose": "share affordable alternative"
+    },
+    "#ootw": {
+        "meaning": "Outfit Of The Week",
+        "category": "outfit_sharing",
+        "purpose": "showcase weekly outfit choices"
+    },
+    "#ltk": {
+        "meaning": "LikeToKnowIt",
+        "category": "affiliate_marketing",
+        "purpose": "monetize through affiliate links"
+    },
+    "#shein": {
+        "meaning": "SHEIN brand",
+        "category": "brand_tag",
+        "purpose": "tag fast fashion retailer"
+    },
+    "#thriftflip": {
+        "meaning": "Thrift Flip",
+        "category": "sustainable_fashion",
+        "purpose": "show thrifted item upcycle"
+    },
+    "#wiwtd": {
+        "meaning": "What I Wore Today",
+        "category": "outfit_sharing",
+        "purpose": "share outfit for specific day"
+    }
+}
 
-
-def load_dataset(dataset_path: str) -> list:
-    """
-    Load the hashtag understanding dataset from JSONL file.
-
-    Args:
-        dataset_path: Path to the JSONL dataset file
-
-    Returns:
-        List of dataset examples
-    """
-    examples = []
-    with jsonlines.open(dataset_path) as reader:
-        for obj in reader:
-            examples.append(obj)
-    return examples
+_UNKNOWN_HASHTAG = {
+    "meaning": "Unknown hashtag",
+    "category": "general",
+    "purpose": "social media engagement"
+}
 
 
 def understand_hashtag(hashtag: str, context: str) -> dict:
@@ -44,67 +81,8 @@ def understand_hashtag(hashtag: str, context: str) -> dict:
     Returns:
         Dictionary with hashtag meaning, category, and purpose
     """
-    hashtag_lower = hashtag.lower()
-
-    # Hashtag knowledge base for demo
-    hashtag_db = {
-        "#ootd": {
-            "meaning": "Outfit Of The Day",
-            "category": "outfit_sharing",
-            "purpose": "showcase daily outfit choice"
-        },
-        "#grwm": {
-            "meaning": "Get Ready With Me",
-            "category": "lifestyle_content",
-            "purpose": "document preparation routine"
-        },
-        "#tryonhaul": {
-            "meaning": "Try On Haul",
-            "category": "shopping_content",
-            "purpose": "show purchased items being worn"
-        },
-        "#iykyk": {
-            "meaning": "If You Know You Know",
-            "category": "insider_reference",
-            "purpose": "subtle flex or insider knowledge"
-        },
-        "#dupealert": {
-            "meaning": "Dupe Alert",
-            "category": "budget_fashion",
-            "purpose": "share affordable alternative"
-        },
-        "#ootw": {
-            "meaning": "Outfit Of The Week",
-            "category": "outfit_sharing",
-            "purpose": "showcase weekly outfit choices"
-        },
-        "#ltk": {
-            "meaning": "LikeToKnowIt",
-            "category": "affiliate_marketing",
-            "purpose": "monetize through affiliate links"
-        },
-        "#shein": {
-            "meaning": "SHEIN brand",
-            "category": "brand_tag",
-            "purpose": "tag fast fashion retailer"
-        },
-        "#thriftflip": {
-            "meaning": "Thrift Flip",
-            "category": "sustainable_fashion",
-            "purpose": "show thrifted item upcycle"
-        },
-        "#wiwtd": {
-            "meaning": "What I Wore Today",
-            "category": "outfit_sharing",
-            "purpose": "share outfit for specific day"
-        }
-    }
-
-    return hashtag_db.get(hashtag_lower, {
-        "meaning": "Unknown hashtag",
-        "category": "general",
-        "purpose": "social media engagement"
-    })
+    # Shallow copy so callers annotating the result can't alter the shared table
+    return dict(_HASHTAG_DB.get(hashtag.lower(), _UNKNOWN_HASHTAG))
 
 
 def simulate_model_response(example: dict, model_name: str) -> dict:
@@ -144,16 +122,22 @@ def calculate_hashtag_score(predicted: dict, expected: dict) -> float:
 
     # Check meaning
     if "meaning" in expected and "meaning" in predicted:
-        if expected["meaning"].lower() == predicted["meaning"].lower():
+        expected_meaning = expected["meaning"].lower()
+        predicted_meaning = predicted["meaning"].lower()
+
+        if expected_meaning == predicted_meaning:
             score += 1.0
-        elif expected["meaning"].lower() in predicted["meaning"].lower() or predicted["meaning"].lower() in expected["meaning"].lower():
+        elif expected_meaning in predicted_meaning or predicted_meaning in expected_meaning:
             score += 0.7
 
     # Check category
     if "category" in expected and "category" in predicted:
-        if expected["category"].lower() == predicted["category"].lower():
+        expected_category = expected["category"].lower()
+        predicted_category = predicted["category"].lower()
+
+        if expected_category == predicted_category:
             score += 1.0
-        elif expected["category"].lower() in predicted["category"].lower() or predicted["category"].lower() in expected["category"].lower():
+        elif expected_category in predicted_category or predicted_category in expected_category:
             score += 0.5
 
     # Check purpose
@@ -176,70 +160,31 @@ def calculate_hashtag_score(predicted: dict, expected: dict) -> float:
     return score / total_components
 
 
-def evaluate_hashtag_understanding(model_name: str = "simulated", dataset_path: str = None) -> dict:
+_SPEC = EvalSpec(
+    name="Hashtag Understanding",
+    dataset=DATASETS_DIR / "hashtag_understanding.jsonl",
+    predict=simulate_model_response,
+    score=calculate_hashtag_score,
+    text_field="hashtag",
+    context_field="context"
+)
+
+
+def evaluate_hashtag_understanding(model_name: str = "simulated", dataset_path: str = None, verbose: bool = False,
+                                   workers: int = None) -> dict:
     """
     Evaluate model performance on hashtag understanding tasks.
 
     Args:
         model_name: Name of the model to evaluate
         dataset_path: Path to dataset file (optional)
+        verbose: Print the header, per-example results and summary (silent otherwise)
+        workers: Number of worker processes for scoring (optional)
 
     Returns:
         Dictionary containing evaluation results and metrics
     """
-    if dataset_path is None:
-        dataset_path = Path(__file__).parent.parent / "datasets" / "hashtag_understanding.jsonl"
-
-    examples = load_dataset(str(dataset_path))
-    results = []
-    total_score = 0
-
-    print(f"\n{'='*60}")
-    print(f"Evaluating Hashtag Understanding - Model: {model_name}")
-    print(f"{'='*60}\n")
-
-    for example in examples:
-        # Get model response
-        model_output = simulate_model_response(example, model_name)
-        expected = example["expected"]
-
-        # Calculate score
-        score = calculate_hashtag_score(model_output, expected)
-        total_score += score
-
-        results.append({
-            "id": example["id"],
-            "hashtag": example["hashtag"],
-            "context": example["context"],
-            "expected": expected,
-            "model_output": model_output,
-            "score": score
-        })
-
-        # Print individual result
-        status = "✓" if score >= 0.7 else "✗"
-        print(f"{status} Example {example['id']}: {score:.2f}")
-        print(f"  Hashtag: {example['hashtag']}")
-        print(f"  Expected: {json.dumps(expected, indent=2)}")
-        print(f"  Predicted: {json.dumps(model_output, indent=2)}\n")
-
-    # Calculate overall metrics
-    avg_score = total_score / len(examples) if examples else 0
-    passed = sum(1 for r in results if r["score"] >= 0.7)
-
-    print(f"{'='*60}")
-    print(f"Results: {passed}/{len(examples)} passed (threshold: 0.7)")
-    print(f"Average Score: {avg_score:.3f}")
-    print(f"{'='*60}\n")
-
-    return {
-        "eval_name": "Hashtag Understanding",
-        "model": model_name,
-        "total_examples": len(examples),
-        "passed": passed,
-        "avg_score": avg_score,
-        "results": results
-    }
+    return run_eval(_SPEC, model_name, dataset_path, verbose, workers)
 
 
 if __name__ == "__main__":
@@ -249,6 +194,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Evaluate hashtag understanding capabilities")
     parser.add_argument("--model", default="simulated", help="Model name to evaluate")
     parser.add_argument("--dataset", default=None, help="Path to dataset file")
+    parser.add_argument("--quiet", action="store_true", help="Suppress progress and per-example output")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
 
     args = parser.parse_args()
-    evaluate_hashtag_understanding(args.model, args.dataset)
+    evaluate_hashtag_understanding(args.model, args.dataset, verbose=not args.quiet, workers=args.workers)
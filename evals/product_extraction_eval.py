@@ -5,31 +5,20 @@ This script evaluates an LLM's ability to extract structured product information
 from unstructured fashion content, including brands, prices, links, and discount codes.
 """
 
-import jsonlines
-import sys
-from pathlib import Path
-import json
+import re
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
 from scoring.metrics import exact_match, partial_match
+from evals.engine import DATASETS_DIR, EvalSpec, load_dataset, run_eval
 
+# Known brands for the demo extractor
+_BRANDS = ["Zara", "Reformation", "Nike", "Levi's", "H&M", "Jacquemus", "Chanel", "Mango", "Bottega Veneta", "Skims"]
 
-def load_dataset(dataset_path: str) -> list:
-    """
-    Load the product extraction dataset from JSONL file.
-
-    Args:
-        dataset_path: Path to the JSONL dataset file
-
-    Returns:
-        List of dataset examples
-    """
-    examples = []
-    with jsonlines.open(dataset_path) as reader:
-        for obj in reader:
-            examples.append(obj)
-    return examples
+# Precompiled patterns shared across every example
+_BRAND_RE = re.compile('|'.join(map(re.escape, _BRANDS)))
+_PRICE_RE = re.compile(r'[\$€£]\d+(?:\.\d{2})?')
+# Searched on the original text, not text_lower: lowercasing can change length
+_CODE_RE = re.compile(r'(?i:code)\s+(\w+)')
+_URL_RE = re.compile(r'https?://\S+')
 
 
 def extract_key_info(text: str) -> dict:
@@ -44,37 +33,33 @@ def extract_key_info(text: str) -> dict:
         Dictionary of extracted product information
     """
     result = {}
+    text_lower = text.lower()
 
     # Brand detection (simple keyword matching for demo)
-    brands = ["Zara", "Reformation", "Nike", "Levi's", "H&M", "Jacquemus", "Chanel", "Mango", "Bottega Veneta", "Skims"]
-    for brand in brands:
-        if brand in text:
-            result["brand"] = brand
-            break
+    brand_match = _BRAND_RE.search(text)
+    if brand_match:
+        result["brand"] = brand_match.group()
 
     # Price detection
-    import re
-    price_pattern = r'[\$€£]\d+(?:\.\d{2})?'
-    prices = re.findall(price_pattern, text)
-    if prices:
-        result["price"] = prices[0]
+    price_match = _PRICE_RE.search(text)
+    if price_match:
+        result["price"] = price_match.group()
 
     # Discount code detection
-    code_pattern = r'code\s+(\w+)'
-    codes = re.findall(code_pattern, text, re.IGNORECASE)
-    if codes:
-        result["discount_code"] = codes[0]
+    # Matched on the original text, so the code keeps its casing
+    code_match = _CODE_RE.search(text)
+    if code_match:
+        result["discount_code"] = code_match.group(1)
 
     # Link detection
-    if "link" in text.lower() or "http" in text:
+    if "link" in text_lower or "http" in text:
         result["link_mentioned"] = True
-        url_pattern = r'https?://[^\s]+'
-        urls = re.findall(url_pattern, text)
-        if urls:
-            result["link"] = urls[0]
+        url_match = _URL_RE.search(text)
+        if url_match:
+            result["link"] = url_match.group()
 
     # Affiliate platform detection
-    if "LTK" in text or "ltk" in text.lower():
+    if "ltk" in text_lower:
         result["affiliate_platform"] = "LTK" if "LTK" in text else "ShopLTK"
 
     return result
@@ -136,69 +121,32 @@ def calculate_extraction_score(predicted: dict, expected: dict) -> float:
     return correct_fields / total_fields if total_fields > 0 else 0.0
 
 
-def evaluate_product_extraction(model_name: str = "simulated", dataset_path: str = None) -> dict:
+_SPEC = EvalSpec(
+    name="Product Extraction",
+    dataset=DATASETS_DIR / "product_extraction.jsonl",
+    predict=simulate_model_response,
+    score=calculate_extraction_score,
+    text_field="text",
+    preview_chars=60,
+    output_label="Extracted"
+)
+
+
+def evaluate_product_extraction(model_name: str = "simulated", dataset_path: str = None, verbose: bool = False,
+                                workers: int = None) -> dict:
     """
     Evaluate model performance on product extraction tasks.
 
     Args:
         model_name: Name of the model to evaluate
         dataset_path: Path to dataset file (optional)
+        verbose: Print the header, per-example results and summary (silent otherwise)
+        workers: Number of worker processes for scoring (optional)
 
     Returns:
         Dictionary containing evaluation results and metrics
     """
-    if dataset_path is None:
-        dataset_path = Path(__file__).parent.parent / "datasets" / "product_extraction.jsonl"
-
-    examples = load_dataset(str(dataset_path))
-    results = []
-    total_score = 0
-
-    print(f"\n{'='*60}")
-    print(f"Evaluating Product Extraction - Model: {model_name}")
-    print(f"{'='*60}\n")
-
-    for example in examples:
-        # Get model response
-        model_output = simulate_model_response(example, model_name)
-        expected = example["expected"]
-
-        # Calculate score
-        score = calculate_extraction_score(model_output, expected)
-        total_score += score
-
-        results.append({
-            "id": example["id"],
-            "text": example["text"],
-            "expected": expected,
-            "model_output": model_output,
-            "score": score
-        })
-
-        # Print individual result
-        status = "✓" if score >= 0.7 else "✗"
-        print(f"{status} Example {example['id']}: {score:.2f}")
-        print(f"  Text: {example['text'][:60]}...")
-        print(f"  Expected: {json.dumps(expected, indent=2)}")
-        print(f"  Extracted: {json.dumps(model_output, indent=2)}\n")
-
-    # Calculate overall metrics
-    avg_score = total_score / len(examples) if examples else 0
-    passed = sum(1 for r in results if r["score"] >= 0.7)
-
-    print(f"{'='*60}")
-    print(f"Results: {passed}/{len(examples)} passed (threshold: 0.7)")
-    print(f"Average Score: {avg_score:.3f}")
-    print(f"{'='*60}\n")
-
-    return {
-        "eval_name": "Product Extraction",
-        "model": model_name,
-        "total_examples": len(examples),
-        "passed": passed,
-        "avg_score": avg_score,
-        "results": results
-    }
+    return run_eval(_SPEC, model_name, dataset_path, verbose, workers)
 
 
 if __name__ == "__main__":
@@ -208,6 +156,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Evaluate product extraction capabilities")
     parser.add_argument("--model", default="simulated", help="Model name to evaluate")
     parser.add_argument("--dataset", default=None, help="Path to dataset file")
+    parser.add_argument("--quiet", action="store_true", help="Suppress progress and per-example output")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
 
     args = parser.parse_args()
-    evaluate_product_extraction(args.model, args.dataset)
+    evaluate_product_extraction(args.model, args.dataset, verbose=not args.quiet, workers=args.workers)
@@ -0,0 +1,22 @@
+"""
+Evaluation Result Records
+
+Lightweight per-example result record shared by all FashionBench evaluations.
+"""
+
+from typing import Any, NamedTuple, Optional
+
+
+class EvalRecord(NamedTuple):
+    """
+    Scored result for a single dataset example.
+
+    Use ``record._asdict()`` when a JSON-serializable dict is needed.
+    """
+
+    id: int
+    text: str
+    expected: Any
+    model_output: Any
+    score: float
+    context: Optional[str] = None
@@ -6,30 +6,32 @@ based on outfit descriptions, identifying categories like bohemian, streetwear,
 corporate, quiet luxury, and more.
 """
 
-import jsonlines
-import sys
-from pathlib import Path
+import ahocorasick
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
 from scoring.metrics import exact_match, fashion_similarity
-
-
-def load_dataset(dataset_path: str) -> list:
-    """
-    Load the style classification dataset from JSONL file.
-
-    Args:
-        dataset_path: Path to the JSONL dataset file
-
-    Returns:
-        List of dataset examples
-    """
-    examples = []
-    with jsonlines.open(dataset_path) as reader:
-        for obj in reader:
-            examples.append(obj)
-    return examples
+from evals.engine import DATASETS_DIR, EvalSpec, load_dataset, run_eval
+
+# Style keyword buckets, in priority order (first matching bucket wins)
+_STYLE_RULES = (
+    ("Corporate/Professional", ("blazer", "trousers", "professional", "tote", "corporate")),
+    ("Grunge/Rock", ("leather jacket", "distressed", "combat boots", "grunge", "band t-shirt")),
+    ("Bohemian/Boho", ("floral", "maxi dress", "basket bag", "bohemian", "woven")),
+    ("Athleisure/Sporty", ("hoodie", "joggers", "sneakers", "athleisure", "sporty")),
+    ("Quiet Luxury/Minimalist", ("cashmere", "quiet luxury", "minimalist", "tailored wool")),
+    ("Streetwear/Urban", ("streetwear", "baggy jeans", "nike", "puffer", "urban")),
+    ("Coquette/Feminine", ("coquette", "pastel", "ribbon", "pearl", "feminine")),
+    ("Hypebeast/Streetwear", ("hypebeast", "cargo pants", "bucket hat", "chains")),
+    ("Coastal/Resort", ("linen", "espadrilles", "coastal", "resort", "straw hat")),
+    ("Classic/Timeless", ("tweed", "classic", "timeless", "kitten heels")),
+)
+
+# Single automaton over every keyword, mapping keyword -> (priority, style)
+_STYLE_AUTOMATON = ahocorasick.Automaton()
+for _priority, (_style, _keywords) in enumerate(_STYLE_RULES):
+    for _keyword in _keywords:
+        if _keyword not in _STYLE_AUTOMATON:
+            _STYLE_AUTOMATON.add_word(_keyword, (_priority, _style))
+_STYLE_AUTOMATON.make_automaton()
 
 
 def classify_style(description: str) -> str:
@@ -45,29 +47,16 @@ def classify_style(description: str) -> str:
     """
     description_lower = description.lower()
 
-    # Keyword-based classification for demo
-    if any(word in description_lower for word in ["blazer", "trousers", "professional", "tote", "corporate"]):
-        return "Corporate/Professional"
-    elif any(word in description_lower for word in ["leather jacket", "distressed", "combat boots", "grunge", "band t-shirt"]):
-        return "Grunge/Rock"
-    elif any(word in description_lower for word in ["floral", "maxi dress", "basket bag", "bohemian", "woven"]):
-        return "Bohemian/Boho"
-    elif any(word in description_lower for word in ["hoodie", "joggers", "sneakers", "athleisure", "sporty"]):
-        return "Athleisure/Sporty"
-    elif any(word in description_lower for word in ["cashmere", "quiet luxury", "minimalist", "tailored wool"]):
-        return "Quiet Luxury/Minimalist"
-    elif any(word in description_lower for word in ["streetwear", "baggy jeans", "nike", "puffer", "urban"]):
-        return "Streetwear/Urban"
-    elif any(word in description_lower for word in ["coquette", "pastel", "ribbon", "pearl", "feminine"]):
-        return "Coquette/Feminine"
-    elif any(word in description_lower for word in ["hypebeast", "cargo pants", "bucket hat", "chains"]):
-        return "Hypebeast/Streetwear"
-    elif any(word in description_lower for word in ["linen", "espadrilles", "coastal", "resort", "straw hat"]):
-        return "Coastal/Resort"
-    elif any(word in description_lower for word in ["tweed", "classic", "timeless", "kitten heels"]):
-        return "Classic/Timeless"
-    else:
-        return "Contemporary/Mixed"
+    # Keyword-based classification for demo: one pass over the text,
+    # keeping the highest-priority bucket that has any keyword present
+    best = None
+    for _, (priority, style) in _STYLE_AUTOMATON.iter(description_lower):
+        if best is None or priority < best[0]:
+            best = (priority, style)
+            if priority == 0:
+                break
+
+    return best[1] if best else "Contemporary/Mixed"
 
 
 def simulate_model_response(example: dict, model_name: str) -> str:
@@ -86,76 +75,53 @@ def simulate_model_response(example: dict, model_name: str) -> str:
     return classify_style(description)
 
 
-def evaluate_style_classification(model_name: str = "simulated", dataset_path: str = None) -> dict:
+def calculate_style_score(predicted: str, expected: str) -> float:
+    """
+    Calculate style classification score.
+
+    Args:
+        predicted: Predicted style category
+        expected: Expected style category
+
+    Returns:
+        Exact match score, falling back to fashion similarity
+    """
+    # Identical labels are the common case; skip both metric calls
+    if predicted and predicted == expected:
+        return 1.0
+
+    exact_score = exact_match(predicted, expected)
+    if exact_score < 1.0:
+        similarity_score = fashion_similarity(predicted, expected)
+        return max(exact_score, similarity_score)
+    return exact_score
+
+
+_SPEC = EvalSpec(
+    name="Style Classification",
+    dataset=DATASETS_DIR / "style_classification.jsonl",
+    predict=simulate_model_response,
+    score=calculate_style_score,
+    text_field="description",
+    preview_chars=50
+)
+
+
+def evaluate_style_classification(model_name: str = "simulated", dataset_path: str = None, verbose: bool = False,
+                                  workers: int = None) -> dict:
     """
     Evaluate model performance on style classification tasks.
 
     Args:
         model_name: Name of the model to evaluate
         dataset_path: Path to dataset file (optional)
+        verbose: Print the header, per-example results and summary (silent otherwise)
+        workers: Number of worker processes for scoring (optional)
 
     Returns:
         Dictionary containing evaluation results and metrics
     """
-    if dataset_path is None:
-        dataset_path = Path(__file__).parent.parent / "datasets" / "style_classification.jsonl"
-
-    examples = load_dataset(str(dataset_path))
-    results = []
-    total_score = 0
-
-    print(f"\n{'='*60}")
-    print(f"Evaluating Style Classification - Model: {model_name}")
-    print(f"{'='*60}\n")
-
-    for example in examples:
-        # Get model response
-        model_output = simulate_model_response(example, model_name)
-        expected = example["expected"]
-
-        # Calculate score
-        # Use exact match with fallback to similarity
-        exact_score = exact_match(model_output, expected)
-        if exact_score < 1.0:
-            similarity_score = fashion_similarity(model_output, expected)
-            score = max(exact_score, similarity_score)
-        else:
-            score = exact_score
-
-        total_score += score
-
-        results.append({
-            "id": example["id"],
-            "description": example["description"],
-            "expected": expected,
-            "model_output": model_output,
-            "score": score
-        })
-
-        # Print individual result
-        status = "✓" if score >= 0.7 else "✗"
-        print(f"{status} Example {example['id']}: {score:.2f}")
-        print(f"  Description: {example['description'][:50]}...")
-        print(f"  Expected: {expected}")
-        print(f"  Predicted: {model_output}\n")
-
-    # Calculate overall metrics
-    avg_score = total_score / len(examples) if examples else 0
-    passed = sum(1 for r in results if r["score"] >= 0.7)
-
-    print(f"{'='*60}")
-    print(f"Results: {passed}/{len(examples)} passed (threshold: 0.7)")
-    print(f"Average Score: {avg_score:.3f}")
-    print(f"{'='*60}\n")
-
-    return {
-        "eval_name": "Style Classification",
-        "model": model_name,
-        "total_examples": len(examples),
-        "passed": passed,
-        "avg_score": avg_score,
-        "results": results
-    }
+    return run_eval(_SPEC, model_name, dataset_path, verbose, workers)
 
 
 if __name__ == "__main__":
@@ -165,6 +131,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Evaluate style classification capabilities")
     parser.add_argument("--model", default="simulated", help="Model name to evaluate")
     parser.add_argument("--dataset", default=None, help="Path to dataset file")
+    parser.add_argument("--quiet", action="store_true", help="Suppress progress and per-example output")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
 
     args = parser.parse_args()
-    evaluate_style_classification(args.model, args.dataset)
+    evaluate_style_classification(args.model, args.dataset, verbose=not args.quiet, workers=args.workers)
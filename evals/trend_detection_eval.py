@@ -5,30 +5,38 @@ This script evaluates an LLM's ability to identify and analyze fashion trends
 from various data sources including social media, runway shows, and market signals.
 """
 
-import jsonlines
+import ahocorasick
 import sys
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
-from scoring.metrics import partial_match, fashion_similarity
-
-
-def load_dataset(dataset_path: str) -> list:
-    """
-    Load the trend detection dataset from JSONL file.
-
-    Args:
-        dataset_path: Path to the JSONL dataset file
-
-    Returns:
-        List of dataset examples
-    """
-    examples = []
-    with jsonlines.open(dataset_path) as reader:
-        for obj in reader:
-            examples.append(obj)
-    return examples
+# Repository root, resolved once; added to the path (once) for imports
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.append(str(_ROOT))
+from scoring.metrics import blended_similarity
+from evals.engine import load_dataset_cached as load_dataset
+from evals.records import EvalRecord
+
+# Trend rules in priority order (first match wins). Each rule lists keyword
+# groups that must all be present; any keyword of a group satisfies it.
+_TREND_RULES = (
+    ((("barbiecore", "pink"),), "Barbiecore and Y2K pink aesthetic revival"),
+    ((("blazer",), ("structured",)), "Oversized tailoring, power dressing, structured silhouettes"),
+    ((("loafer", "mini bag"),), "Chunky loafers, mini bags, long coats"),
+    ((("dopamine",),), "Dopamine dressing and maximalist color trend"),
+    ((("quiet luxury",),), "Quiet luxury and stealth wealth aesthetic"),
+    ((("sustainable",),), "90s minimalism, sustainability, and gender-neutral fashion"),
+    ((("balletcore",),), "Balletcore, clean girl aesthetic, cozy cardio"),
+    ((("streetwear",),), "Luxury streetwear fusion, sneaker culture"),
+)
+
+# Every trigger keyword in one automaton, scanned once per context
+_TREND_AUTOMATON = ahocorasick.Automaton()
+for _groups, _ in _TREND_RULES:
+    for _group in _groups:
+        for _keyword in _group:
+            _TREND_AUTOMATON.add_word(_keyword, _keyword)
+_TREND_AUTOMATON.make_automaton()
 
 
 def simulate_model_response(example: dict, model_name: str) -> str:
@@ -48,84 +56,85 @@ def simulate_model_response(example: dict, model_name: str) -> str:
     context = example.get("context", "")
     question = example.get("question", "")
 
-    # Simple keyword-based simulation for demo purposes
-    if "barbiecore" in context.lower() or "pink" in context.lower():
-        return "Barbiecore and Y2K pink aesthetic revival"
-    elif "blazer" in context.lower() and "structured" in context.lower():
-        return "Oversized tailoring, power dressing, structured silhouettes"
-    elif "loafer" in context.lower() or "mini bag" in context.lower():
-        return "Chunky loafers, mini bags, long coats"
-    elif "dopamine" in context.lower():
-        return "Dopamine dressing and maximalist color trend"
-    elif "quiet luxury" in context.lower():
-        return "Quiet luxury and stealth wealth aesthetic"
-    elif "sustainable" in context.lower():
-        return "90s minimalism, sustainability, and gender-neutral fashion"
-    elif "balletcore" in context.lower():
-        return "Balletcore, clean girl aesthetic, cozy cardio"
-    elif "streetwear" in context.lower():
-        return "Luxury streetwear fusion, sneaker culture"
-    else:
-        return "Contemporary fashion trend"
-
-
-def evaluate_trend_detection(model_name: str = "simulated", dataset_path: str = None) -> dict:
+    # Simple keyword-based simulation for demo purposes: collect every
+    # keyword hit in one pass, then take the first rule they satisfy
+    found = {keyword for _, keyword in _TREND_AUTOMATON.iter(context.lower())}
+    if found:
+        for groups, response in _TREND_RULES:
+            if all(not found.isdisjoint(group) for group in groups):
+                return response
+
+    return "Contemporary fashion trend"
+
+
+def evaluate_trend_detection(model_name: str = "simulated", dataset_path: str = None, verbose: bool = False) -> dict:
     """
     Evaluate model performance on trend detection tasks.
 
     Args:
         model_name: Name of the model to evaluate
         dataset_path: Path to dataset file (optional)
+        verbose: Print the header, per-example results and summary (silent otherwise)
 
     Returns:
         Dictionary containing evaluation results and metrics
     """
     if dataset_path is None:
-        dataset_path = Path(__file__).parent.parent / "datasets" / "trend_detection.jsonl"
+        dataset_path = _ROOT / "datasets" / "trend_detection.jsonl"
 
     examples = load_dataset(str(dataset_path))
     results = []
+    output_lines = []
     total_score = 0
+    passed = 0
+    pair_scores = {}
 
-    print(f"\n{'='*60}")
-    print(f"Evaluating Trend Detection - Model: {model_name}")
-    print(f"{'='*60}\n")
+    if verbose:
+        print(f"\n{'='*60}")
+        print(f"Evaluating Trend Detection - Model: {model_name}")
+        print(f"{'='*60}\n")
 
     for example in examples:
         # Get model response
         model_output = simulate_model_response(example, model_name)
         expected = example["expected"]
 
-        # Calculate scores using different metrics
-        partial_score = partial_match(model_output, expected)
-        similarity_score = fashion_similarity(model_output, expected)
-
-        # Average the scores
-        final_score = (partial_score + similarity_score) / 2
+        # Average of partial_match and fashion_similarity, tokenized once;
+        # the simulator repeats canonical responses, so each unique pair is scored once
+        pair = (model_output, expected)
+        final_score = pair_scores.get(pair)
+        if final_score is None:
+            final_score = pair_scores[pair] = blended_similarity(model_output, expected)
         total_score += final_score
-
-        results.append({
-            "id": example["id"],
-            "question": example["question"],
-            "expected": expected,
-            "model_output": model_output,
-            "score": final_score
-        })
-
-        # Print individual result
-        status = "✓" if final_score >= 0.7 else "✗"
-        print(f"{status} Example {example['id']}: {final_score:.2f}")
-        print(f"  Expected: {expected}")
-        print(f"  Got: {model_output}\n")
+        if final_score >= 0.7:
+            passed += 1
+
+        results.append(EvalRecord(
+            id=example["id"],
+            text=example["question"],
+            expected=expected,
+            model_output=model_output,
+            score=final_score
+        ))
+
+        # Buffer individual result
+        if verbose:
+            status = "✓" if final_score >= 0.7 else "✗"
+            output_lines.append(f"{status} Example {example['id']}: {final_score:.2f}")
+            output_lines.append(f"  Expected: {expected}")
+            output_lines.append(f"  Got: {model_output}\n")
+
+    if output_lines:
+        sys.stdout.write("\n".join(output_lines) + "\n")
 
     # Calculate overall metrics
     avg_score = total_score / len(examples) if examples else 0
-    passed = sum(1 for r in results if r["score"] >= 0.7)
 
-    print(f"{'='*60}")
-    print(f"Results: {passed}/{len(examples)} passed (threshold: 0.7)")
-    print(f"Average Score: {avg_score:.3f}")
-    print(f"{'='*60}\n")
+    if verbose:
+        print(f"{'='*60}")
+        print(f"Results: {passed}/{len(examples)} passed (threshold: 0.7)")
+        print(f"Average Score: {avg_score:.3f}")
+        print(f"{'='*60}\n")
 
     return {
         "eval_name": "Trend Detection",
@@ -144,6 +153,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Evaluate trend detection capabilities")
     parser.add_argument("--model", default="simulated", help="Model name to evaluate")
     parser.add_argument("--dataset", default=None, help="Path to dataset file")
+    parser.add_argument("--quiet", action="store_true", help="Suppress progress and per-example output")
 
     args = parser.parse_args()
-    evaluate_trend_detection(args.model, args.dataset)
+    evaluate_trend_detection(args.model, args.dataset, verbose=not args.quiet)
@@ -5,30 +5,57 @@ This script evaluates an LLM's ability to create engaging fashion content,
 including caption rewriting, style descriptions, and brand voice adaptation.
 """
 
-import jsonlines
+import ahocorasick
 import sys
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+# Repository root, resolved once; added to the path (once) for imports
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.append(str(_ROOT))
 from scoring.metrics import partial_match, fashion_similarity
-
-
-def load_dataset(dataset_path: str) -> list:
-    """
-    Load the caption rewriting dataset from JSONL file.
-
-    Args:
-        dataset_path: Path to the JSONL dataset file
-
-    Returns:
-        List of dataset examples
-    """
-    examples = []
-    with jsonlines.open(dataset_path) as reader:
-        for obj in reader:
-            examples.append(obj)
-    return examples
+from evals.engine import load_dataset_cached as load_dataset
+from evals.records import EvalRecord
+
+# Caption templates in priority order (first match wins). Each rule lists
+# keyword groups that must all be present; any keyword of a group satisfies it.
+_CAPTION_RULES = (
+    ((("blazer",), ("jeans",)),
+     "Elevated casual perfection: tailored blazer meets classic denim. Sophisticated yet comfortable."),
+    ((("floral",), ("midi",)),
+     "Spring blooms in this dreamy floral midi. Effortless elegance with garden party charm."),
+    ((("sneakers",), ("white",)),
+     "Statement sneakers that steal the show. Clean, bold, endlessly wearable."),
+    ((("little black dress", "lbd"),),
+     "That LBD energy: timeless, confident, unforgettable. When the dress speaks volumes."),
+    ((("sweater",), ("leggings",)),
+     "Cozy season done right: wrapped in comfort without sacrificing style."),
+    ((("pencil skirt",), ("blouse",)),
+     "Boardroom ready: polished power dressing meets feminine sophistication."),
+    ((("vintage", "thrifted"),),
+     "Sustainable style wins: this vintage treasure proves pre-loved is best. Thrifted, not bought."),
+    ((("linen",), ("summer",)),
+     "Sun-soaked sophistication: breezy linens for endless summer days. Vacation mode on."),
+    ((("coat",), ("bold",)),
+     "That compliment magnet: when your coat steals the spotlight. Bold moves, big impact."),
+    ((("loungewear",),),
+     "Elevated lounging: staying in never looked this chic. Cozy, coordinated, completely stylish."),
+)
+
+# Every template keyword in one automaton, scanned once per context
+_CAPTION_AUTOMATON = ahocorasick.Automaton()
+for _groups, _ in _CAPTION_RULES:
+    for _group in _groups:
+        for _keyword in _group:
+            _CAPTION_AUTOMATON.add_word(_keyword, _keyword)
+_CAPTION_AUTOMATON.make_automaton()
+
+# Descriptive words that mark elevated vocabulary, matched as substrings in one pass
+_DESCRIPTIVE_WORDS = ("elevated", "chic", "sophisticated", "effortless", "timeless", "bold", "dreamy", "cozy")
+_DESCRIPTIVE_AUTOMATON = ahocorasick.Automaton()
+for _word in _DESCRIPTIVE_WORDS:
+    _DESCRIPTIVE_AUTOMATON.add_word(_word, _word)
+_DESCRIPTIVE_AUTOMATON.make_automaton()
 
 
 def rewrite_caption(original: str, context: str, style: str) -> str:
@@ -44,31 +71,15 @@ def rewrite_caption(original: str, context: str, style: str) -> str:
     Returns:
         Rewritten engaging caption
     """
-    # Simple template-based rewriting for demo
-    context_lower = context.lower()
-
-    if "blazer" in context_lower and "jeans" in context_lower:
-        return "Elevated casual perfection: tailored blazer meets classic denim. Sophisticated yet comfortable."
-    elif "floral" in context_lower and "midi" in context_lower:
-        return "Spring blooms in this dreamy floral midi. Effortless elegance with garden party charm."
-    elif "sneakers" in context_lower and "white" in context_lower:
-        return "Statement sneakers that steal the show. Clean, bold, endlessly wearable."
-    elif "little black dress" in context_lower or "lbd" in context_lower:
-        return "That LBD energy: timeless, confident, unforgettable. When the dress speaks volumes."
-    elif "sweater" in context_lower and "leggings" in context_lower:
-        return "Cozy season done right: wrapped in comfort without sacrificing style."
-    elif "pencil skirt" in context_lower and "blouse" in context_lower:
-        return "Boardroom ready: polished power dressing meets feminine sophistication."
-    elif "vintage" in context_lower or "thrifted" in context_lower:
-        return "Sustainable style wins: this vintage treasure proves pre-loved is best. Thrifted, not bought."
-    elif "linen" in context_lower and "summer" in context_lower:
-        return "Sun-soaked sophistication: breezy linens for endless summer days. Vacation mode on."
-    elif "coat" in context_lower and "bold" in context_lower:
-        return "That compliment magnet: when your coat steals the spotlight. Bold moves, big impact."
-    elif "loungewear" in context_lower:
-        return "Elevated lounging: staying in never looked this chic. Cozy, coordinated, completely stylish."
-    else:
-        return f"Transformed from '{original}' into elevated fashion content with {style} vibes."
+    # Simple template-based rewriting for demo: collect every keyword hit
+    # in one pass, then take the first template whose groups are all present
+    found = {keyword for _, keyword in _CAPTION_AUTOMATON.iter(context.lower())}
+    if found:
+        for groups, caption in _CAPTION_RULES:
+            if all(not found.isdisjoint(group) for group in groups):
+                return caption
+
+    return f"Transformed from '{original}' into elevated fashion content with {style} vibes."
 
 
 def simulate_model_response(example: dict, model_name: str) -> str:
@@ -102,59 +113,51 @@ def evaluate_writing_quality(generated: str, expected: str) -> float:
         Quality score between 0 and 1
     """
     score = 0.0
-    weights = []
 
     # Check length (good captions should be substantial)
     if len(generated) > 50:
         score += 0.2
-        weights.append(1)
-    else:
-        weights.append(1)
 
     # Check for descriptive words (elevated vocabulary)
-    descriptive_words = ["elevated", "chic", "sophisticated", "effortless", "timeless", "bold", "dreamy", "cozy"]
-    if any(word in generated.lower() for word in descriptive_words):
+    if next(_DESCRIPTIVE_AUTOMATON.iter(generated.lower()), None) is not None:
         score += 0.3
-        weights.append(1)
-    else:
-        weights.append(1)
 
     # Check structure (should have multiple sentences or clauses)
     if generated.count('.') >= 1 or generated.count(':') >= 1:
         score += 0.2
-        weights.append(1)
-    else:
-        weights.append(1)
 
     # Semantic similarity to expected
     similarity = fashion_similarity(generated, expected)
     score += similarity * 0.3
-    weights.append(1)
 
     return score
 
 
-def evaluate_fashion_writing(model_name: str = "simulated", dataset_path: str = None) -> dict:
+def evaluate_fashion_writing(model_name: str = "simulated", dataset_path: str = None, verbose: bool = False) -> dict:
     """
     Evaluate model performance on fashion writing tasks.
 
     Args:
         model_name: Name of the model to evaluate
         dataset_path: Path to dataset file (optional)
+        verbose: Print the header, per-example results and summary (silent otherwise)
 
     Returns:
         Dictionary containing evaluation results and metrics
     """
     if dataset_path is None:
-        dataset_path = Path(__file__).parent.parent / "datasets" / "caption_rewriting.jsonl"
+        dataset_path = _ROOT / "datasets" / "caption_rewriting.jsonl"
 
     examples = load_dataset(str(dataset_path))
     results = []
+    output_lines = []
     total_score = 0
+    passed = 0
 
-    print(f"\n{'='*60}")
-    print(f"Evaluating Fashion Writing - Model: {model_name}")
-    print(f"{'='*60}\n")
+    if verbose:
+        print(f"\n{'='*60}")
+        print(f"Evaluating Fashion Writing - Model: {model_name}")
+        print(f"{'='*60}\n")
 
     for example in examples:
         # Get model response
@@ -164,31 +167,37 @@ def evaluate_fashion_writing(model_name: str = "simulated", dataset_path: str =
         # Calculate score
         score = evaluate_writing_quality(model_output, expected)
         total_score += score
-
-        results.append({
-            "id": example["id"],
-            "original": example["original"],
-            "context": example["context"],
-            "expected": expected,
-            "model_output": model_output,
-            "score": score
-        })
-
-        # Print individual result
-        status = "✓" if score >= 0.6 else "✗"
-        print(f"{status} Example {example['id']}: {score:.2f}")
-        print(f"  Original: '{example['original']}'")
-        print(f"  Generated: {model_output}")
-        print(f"  Expected: {expected}\n")
+        if score >= 0.6:
+            passed += 1
+
+        results.append(EvalRecord(
+            id=example["id"],
+            text=example["original"],
+            expected=expected,
+            model_output=model_output,
+            score=score,
+            context=example["context"]
+        ))
+
+        # Buffer individual result
+        if verbose:
+            status = "✓" if score >= 0.6 else "✗"
+            output_lines.append(f"{status} Example {example['id']}: {score:.2f}")
+            output_lines.append(f"  Original: '{example['original']}'")
+            output_lines.append(f"  Generated: {model_output}")
+            output_lines.append(f"  Expected: {expected}\n")
+
+    if output_lines:
+        sys.stdout.write("\n".join(output_lines) + "\n")
 
     # Calculate overall metrics
     avg_score = total_score / len(examples) if examples else 0
-    passed = sum(1 for r in results if r["score"] >= 0.6)
 
-    print(f"{'='*60}")
-    print(f"Results: {passed}/{len(examples)} passed (threshold: 0.6)")
-    print(f"Average Score: {avg_score:.3f}")
-    print(f"{'='*60}\n")
+    if verbose:
+        print(f"{'='*60}")
+        print(f"Results: {passed}/{len(examples)} passed (threshold: 0.6)")
+        print(f"Average Score: {avg_score:.3f}")
+        print(f"{'='*60}\n")
 
     return {
         "eval_name": "Fashion Writing",
@@ -207,6 +216,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Evaluate fashion writing capabilities")
     parser.add_argument("--model", default="simulated", help="Model name to evaluate")
     parser.add_argument("--dataset", default=None, help="Path to dataset file")
+    parser.add_argument("--quiet", action="store_true", help="Suppress progress and per-example output")
 
     args = parser.parse_args()
-    evaluate_fashion_writing(args.model, args.dataset)
+    evaluate_fashion_writing(args.model, args.dataset, verbose=not args.quiet)
@@ -9,15 +9,15 @@ Usage:
     python run_fashionbench.py --model claude-3-sonnet
     python run_fashionbench.py --model gpt-4 --eval trend_detection
     python run_fashionbench.py --model simulated --verbose
+    python run_fashionbench.py run --plain   (plain text, no rich/typer)
 """
 
+import argparse
+import os
+import re
 import sys
-from pathlib import Path
-import typer
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import box
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from typing import Optional
 
 # Import all evaluation modules
@@ -28,9 +28,14 @@ from evals.writing_eval import evaluate_fashion_writing
 from evals.hashtag_eval import evaluate_hashtag_understanding
 from evals.affiliate_eval import evaluate_affiliate_detection
 
-# Initialize Rich console for beautiful output
-console = Console()
-app = typer.Typer(help="FashionBench: Domain-specific LLM evaluation for fashion industry")
+# Rich console for beautiful output. rich and typer are imported lazily in main(),
+# so --plain runs (and installs without them) skip their import cost.
+console = None
+
+APP_HELP = "FashionBench: Domain-specific LLM evaluation for fashion industry"
+
+# Rich markup tags such as [bold cyan] or [/green], stripped for plain output
+_MARKUP_RE = re.compile(r"\[/?[a-z ]+\]")
 
 
 # Define available evaluations
@@ -68,6 +73,14 @@ EVALUATIONS = {
 }
 
 
+def echo(message: str = "", style: Optional[str] = None):
+    """Print a message with rich markup, or without the markup when running plain."""
+    if console is not None:
+        console.print(message, style=style)
+    else:
+        print(_MARKUP_RE.sub("", message))
+
+
 def print_header():
     """Print FashionBench header."""
     header = """
@@ -81,24 +94,17 @@ def print_header():
     ║                                                           ║
     ╚═══════════════════════════════════════════════════════════╝
     """
-    console.print(header, style="bold magenta")
+    echo(header, style="bold magenta")
 
 
 def print_results_table(all_results: list):
     """
-    Print formatted results table using Rich.
+    Print formatted results table using Rich (or aligned plain text).
 
     Args:
         all_results: List of evaluation result dictionaries
     """
-    table = Table(title="FashionBench Results", box=box.ROUNDED)
-
-    table.add_column("Evaluation", style="cyan", no_wrap=True)
-    table.add_column("Examples", justify="center", style="white")
-    table.add_column("Passed", justify="center", style="green")
-    table.add_column("Avg Score", justify="center", style="yellow")
-    table.add_column("Status", justify="center")
-
+    rows = []
     total_examples = 0
     total_passed = 0
     total_score = 0.0
@@ -125,100 +131,129 @@ def print_results_table(all_results: list):
             status = "✗ Needs Work"
             status_style = "red"
 
-        table.add_row(
-            eval_name,
-            str(examples),
-            f"{passed}/{examples}",
-            f"{avg_score:.3f}",
-            status,
-            style=status_style if pass_rate < 0.6 else None
-        )
+        rows.append((
+            (eval_name, str(examples), f"{passed}/{examples}", f"{avg_score:.3f}", status),
+            status_style if pass_rate < 0.6 else None
+        ))
 
-    # Add summary row
+    # Summary row
     avg_overall = total_score / len(all_results) if all_results else 0
+    overall = ("OVERALL", str(total_examples), f"{total_passed}/{total_examples}", f"{avg_overall:.3f}", "Summary")
+
+    if console is None:
+        columns = ("Evaluation", "Examples", "Passed", "Avg Score", "Status")
+        widths = [max(len(row[i]) for row in (columns, overall, *(cells for cells, _ in rows)))
+                  for i in range(len(columns))]
+
+        def line(cells):
+            return "  ".join(cell.ljust(width) for cell, width in zip(cells, widths)).rstrip()
+
+        print("\nFashionBench Results\n")
+        print(line(columns))
+        print(line(["-" * width for width in widths]))
+        for cells, _ in rows:
+            print(line(cells))
+        print(line(["-" * width for width in widths]))
+        print(line(overall))
+        print()
+        return
+
+    from rich import box
+    from rich.table import Table
+
+    table = Table(title="FashionBench Results", box=box.ROUNDED)
+
+    table.add_column("Evaluation", style="cyan", no_wrap=True)
+    table.add_column("Examples", justify="center", style="white")
+    table.add_column("Passed", justify="center", style="green")
+    table.add_column("Avg Score", justify="center", style="yellow")
+    table.add_column("Status", justify="center")
+
+    for cells, style in rows:
+        table.add_row(*cells, style=style)
+
     table.add_section()
-    table.add_row(
-        "OVERALL",
-        str(total_examples),
-        f"{total_passed}/{total_examples}",
-        f"{avg_overall:.3f}",
-        "Summary",
-        style="bold white"
-    )
+    table.add_row(*overall, style="bold white")
 
     console.print("\n")
     console.print(table)
     console.print("\n")
 
 
-@app.command()
-def run(
-    model: str = typer.Option("simulated", "--model", "-m", help="Model name to evaluate (e.g., claude-3-sonnet, gpt-4)"),
-    eval_name: Optional[str] = typer.Option(None, "--eval", "-e", help="Specific evaluation to run (omit to run all)"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
-    list_evals: bool = typer.Option(False, "--list", "-l", help="List all available evaluations")
-):
+def print_panel(text: str, title: str, border_style: str):
+    """Print text in a Rich panel, or under a plain title line."""
+    if console is None:
+        print(f"\n== {title} ==")
+        echo(text)
+        return
+
+    from rich.panel import Panel
+
+    console.print(Panel(text, title=title, border_style=border_style))
+
+
+def run(model: str = "simulated", eval_name: Optional[str] = None, verbose: bool = False, list_evals: bool = False):
     """
     Run FashionBench evaluations on a specified model.
 
-    Examples:
-        python run_fashionbench.py --model claude-3-sonnet
-        python run_fashionbench.py --model gpt-4 --eval trend_detection
-        python run_fashionbench.py --list
+    Args:
+        model: Model name to evaluate
+        eval_name: Specific evaluation to run (None runs all)
+        verbose: Show detailed output
+        list_evals: List all available evaluations instead of running them
     """
 
     # List evaluations if requested
     if list_evals:
-        console.print("\n[bold cyan]Available Evaluations:[/bold cyan]\n")
+        echo("\n[bold cyan]Available Evaluations:[/bold cyan]\n")
         for key, info in EVALUATIONS.items():
-            console.print(f"  • [green]{key}[/green]: {info['description']}")
-        console.print("\n")
+            echo(f"  • [green]{key}[/green]: {info['description']}")
+        echo("\n")
         return
 
     print_header()
 
-    console.print(f"[bold]Model:[/bold] {model}")
-    console.print(f"[bold]Mode:[/bold] {'Single Eval' if eval_name else 'Full Suite'}\n")
+    echo(f"[bold]Model:[/bold] {model}")
+    echo(f"[bold]Mode:[/bold] {'Single Eval' if eval_name else 'Full Suite'}\n")
 
     # Determine which evaluations to run
     if eval_name:
         if eval_name not in EVALUATIONS:
-            console.print(f"[red]Error: Unknown evaluation '{eval_name}'[/red]")
-            console.print(f"[yellow]Use --list to see available evaluations[/yellow]")
+            echo(f"[red]Error: Unknown evaluation '{eval_name}'[/red]")
+            echo(f"[yellow]Use --list to see available evaluations[/yellow]")
             sys.exit(1)
         evals_to_run = {eval_name: EVALUATIONS[eval_name]}
     else:
         evals_to_run = EVALUATIONS
 
-    # Run evaluations
-    all_results = []
+    # Run evaluations concurrently; verbose runs stay sequential so their output doesn't interleave
+    results_by_key = {}
+    max_workers = 1 if verbose else min(len(evals_to_run), os.cpu_count() or 1)
 
-    with console.status("[bold green]Running evaluations...", spinner="dots") as status:
-        for key, eval_info in evals_to_run.items():
-            status.update(f"[bold green]Running {eval_info['name']}...")
+    spinner = console.status("[bold green]Running evaluations...", spinner="dots") if console else nullcontext()
 
-            try:
-                # Run evaluation (suppress output if not verbose)
-                if not verbose:
-                    # Redirect stdout temporarily
-                    import io
-                    old_stdout = sys.stdout
-                    sys.stdout = io.StringIO()
+    with spinner as status:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(eval_info["function"], model_name=model, verbose=verbose): key
+                for key, eval_info in evals_to_run.items()
+            }
 
-                result = eval_info["function"](model_name=model)
+            for done, future in enumerate(as_completed(futures), start=1):
+                eval_info = evals_to_run[futures[future]]
 
-                if not verbose:
-                    sys.stdout = old_stdout
+                try:
+                    results_by_key[futures[future]] = future.result()
+                    echo(f"[green]✓[/green] {eval_info['name']} completed")
 
-                all_results.append(result)
+                except Exception as e:
+                    echo(f"[red]✗[/red] {eval_info['name']} failed: {str(e)}")
 
-                console.print(f"[green]✓[/green] {eval_info['name']} completed")
+                if status is not None:
+                    status.update(f"[bold green]Running evaluations... ({done}/{len(futures)} done)")
 
-            except Exception as e:
-                if not verbose:
-                    sys.stdout = old_stdout
-                console.print(f"[red]✗[/red] {eval_info['name']} failed: {str(e)}")
-                continue
+    # Keep the suite's order in the results table, whatever order evals finished in
+    all_results = [results_by_key[key] for key in evals_to_run if key in results_by_key]
 
     # Print results
     if all_results:
@@ -244,23 +279,21 @@ def run(
             color = "red"
             message = "Needs significant improvement for fashion tasks."
 
-        summary = Panel(
+        print_panel(
             f"[bold]Overall Grade: {grade}[/bold]\n"
             f"Average Score: {avg_score:.3f}\n\n"
             f"{message}",
             title="Summary",
             border_style=color
         )
-        console.print(summary)
 
     else:
-        console.print("[red]No evaluations completed successfully.[/red]")
+        echo("[red]No evaluations completed successfully.[/red]")
 
     # Footer
-    console.print("\n[dim]Created by Ortal | ortal@onsight-analytics.com[/dim]")
+    echo("\n[dim]Created by Ortal | ortal@onsight-analytics.com[/dim]")
 
 
-@app.command()
 def info():
     """Show information about FashionBench."""
     print_header()
@@ -291,8 +324,90 @@ def info():
     python run_fashionbench.py --help
     """
 
-    console.print(Panel(info_text, title="FashionBench Info", border_style="magenta"))
+    print_panel(info_text, title="FashionBench Info", border_style="magenta")
+
+
+def build_app():
+    """Build the Typer app (rich output) around run() and info()."""
+    import typer
+
+    app = typer.Typer(help=APP_HELP)
+
+    @app.command("run")
+    def run_command(
+        model: str = typer.Option("simulated", "--model", "-m", help="Model name to evaluate (e.g., claude-3-sonnet, gpt-4)"),
+        eval_name: Optional[str] = typer.Option(None, "--eval", "-e", help="Specific evaluation to run (omit to run all)"),
+        verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
+        list_evals: bool = typer.Option(False, "--list", "-l", help="List all available evaluations"),
+        plain: bool = typer.Option(False, "--plain", help="Plain text output without rich/typer")
+    ):
+        """
+        Run FashionBench evaluations on a specified model.
+
+        Examples:
+            python run_fashionbench.py --model claude-3-sonnet
+            python run_fashionbench.py --model gpt-4 --eval trend_detection
+            python run_fashionbench.py --list
+        """
+        # --plain is handled by main() before typer starts; the option only documents it
+        run(model, eval_name, verbose, list_evals)
+
+    @app.command("info")
+    def info_command():
+        """Show information about FashionBench."""
+        info()
+
+    return app
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argparse CLI used for --plain runs and when rich/typer are unavailable."""
+    parser = argparse.ArgumentParser(description=APP_HELP)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run FashionBench evaluations on a specified model")
+    run_parser.add_argument("--model", "-m", default="simulated", help="Model name to evaluate (e.g., claude-3-sonnet, gpt-4)")
+    run_parser.add_argument("--eval", "-e", dest="eval_name", default=None, help="Specific evaluation to run (omit to run all)")
+    run_parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed output")
+    run_parser.add_argument("--list", "-l", dest="list_evals", action="store_true", help="List all available evaluations")
+    # --plain is stripped by main() before parsing; listed here so it shows in --help
+    run_parser.add_argument("--plain", action="store_true", help="Plain text output without rich/typer")
+
+    subparsers.add_parser("info", help="Show information about FashionBench")
+    return parser
+
+
+def main(argv: Optional[list] = None):
+    """
+    CLI entry point. Uses typer + rich unless --plain is given or they aren't installed.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    global console
+
+    argv = sys.argv[1:] if argv is None else list(argv)
+    plain = "--plain" in argv
+
+    if not plain:
+        try:
+            from rich.console import Console
+            app = build_app()
+        except ImportError:
+            plain = True
+
+    if plain:
+        args = build_parser().parse_args([arg for arg in argv if arg != "--plain"])
+        if args.command == "run":
+            run(args.model, args.eval_name, args.verbose, args.list_evals)
+        else:
+            info()
+        return
+
+    # Initialize Rich console for beautiful output
+    console = Console()
+    app(args=argv)
 
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -0,0 +1 @@
+"""FashionBench scoring metrics."""
@@ -6,9 +6,37 @@ on fashion-specific tasks. Includes exact match, partial match, and custom
 fashion similarity metrics.
 """
 
-from typing import Union, List
+from functools import lru_cache
+from typing import Any, Union, List
 import re
 
+# Word tokenizer shared by the overlap-based metrics
+_WORD_RE = re.compile(r'\w+')
+
+# The string-pair metrics are pure, so repeated (predicted, expected) pairs are memoized
+_PAIR_CACHE_SIZE = 4096
+
+# Fashion synonym groups: canonical term -> synonyms
+_FASHION_SYNONYMS = {
+    "luxury": ["high-end", "premium", "upscale", "designer"],
+    "casual": ["relaxed", "laid-back", "comfortable", "easy"],
+    "elegant": ["sophisticated", "refined", "polished", "chic"],
+    "trendy": ["fashionable", "stylish", "on-trend", "contemporary"],
+    "vintage": ["retro", "classic", "throwback", "timeless"],
+    "minimalist": ["simple", "clean", "understated", "minimal"],
+    "bohemian": ["boho", "hippie", "free-spirited", "eclectic"],
+    "streetwear": ["urban", "street-style", "casual-cool"],
+    "athleisure": ["sporty", "athletic", "activewear"],
+    "sustainable": ["eco-friendly", "ethical", "conscious", "green"],
+}
+
+# Flattened view built once: every term -> index of its group in _GROUP_TERMS
+_GROUP_TERMS = tuple((key, *synonyms) for key, synonyms in _FASHION_SYNONYMS.items())
+_SYNONYM_GROUP = {}
+for _group, _terms in enumerate(_GROUP_TERMS):
+    for _term in _terms:
+        _SYNONYM_GROUP.setdefault(_term, _group)
+
 
 def exact_match(predicted: str, expected: str) -> float:
     """
@@ -30,6 +58,7 @@ def exact_match(predicted: str, expected: str) -> float:
     return 1.0 if predicted_clean == expected_clean else 0.0
 
 
+@lru_cache(maxsize=_PAIR_CACHE_SIZE)
 def partial_match(predicted: str, expected: str, threshold: float = 0.5) -> float:
     """
     Calculate partial match score based on word overlap.
@@ -46,21 +75,26 @@ def partial_match(predicted: str, expected: str, threshold: float = 0.5) -> floa
         return 0.0
 
     # Tokenize into words
-    predicted_words = set(re.findall(r'\w+', predicted.lower()))
-    expected_words = set(re.findall(r'\w+', expected.lower()))
+    predicted_words = set(_WORD_RE.findall(predicted.lower()))
+    expected_words = set(_WORD_RE.findall(expected.lower()))
+
+    return _word_overlap_score(predicted_words, expected_words)
 
+
+def _word_overlap_score(predicted_words: set, expected_words: set) -> float:
+    """Average of Jaccard similarity and recall over pre-tokenized word sets."""
     if not expected_words:
         return 0.0
 
-    # Calculate overlap
-    intersection = predicted_words & expected_words
-    union = predicted_words | expected_words
+    # Calculate overlap; |A ∪ B| = |A| + |B| - |A ∩ B|, so the union set is never built
+    overlap = len(predicted_words & expected_words)
+    union_size = len(predicted_words) + len(expected_words) - overlap
 
     # Jaccard similarity
-    jaccard = len(intersection) / len(union) if union else 0.0
+    jaccard = overlap / union_size if union_size else 0.0
 
     # Also calculate recall (what proportion of expected words were found)
-    recall = len(intersection) / len(expected_words)
+    recall = overlap / len(expected_words)
 
     # Return average of Jaccard and recall
     score = (jaccard + recall) / 2
@@ -68,6 +102,7 @@ def partial_match(predicted: str, expected: str, threshold: float = 0.5) -> floa
     return score
 
 
+@lru_cache(maxsize=_PAIR_CACHE_SIZE)
 def fashion_similarity(predicted: str, expected: str) -> float:
     """
     Custom fashion-specific similarity metric.
@@ -86,22 +121,6 @@ def fashion_similarity(predicted: str, expected: str) -> float:
     predicted_lower = predicted.lower()
     expected_lower = expected.lower()
 
-    # Define fashion synonym groups
-    fashion_synonyms = {
-        "luxury": ["high-end", "premium", "upscale", "designer"],
-        "casual": ["relaxed", "laid-back", "comfortable", "easy"],
-        "elegant": ["sophisticated", "refined", "polished", "chic"],
-        "trendy": ["fashionable", "stylish", "on-trend", "contemporary"],
-        "vintage": ["retro", "classic", "throwback", "timeless"],
-        "minimalist": ["simple", "clean", "understated", "minimal"],
-        "bohemian": ["boho", "hippie", "free-spirited", "eclectic"],
-        "streetwear": ["urban", "street-style", "casual-cool"],
-        "athleisure": ["sporty", "athletic", "activewear"],
-        "sustainable": ["eco-friendly", "ethical", "conscious", "green"],
-    }
-
-    score = 0.0
-
     # Check for exact match first
     if predicted_lower == expected_lower:
         return 1.0
@@ -111,28 +130,41 @@ def fashion_similarity(predicted: str, expected: str) -> float:
         return 0.9
 
     # Tokenize
-    predicted_words = set(re.findall(r'\w+', predicted_lower))
-    expected_words = set(re.findall(r'\w+', expected_lower))
+    predicted_words = set(_WORD_RE.findall(predicted_lower))
+    expected_words = set(_WORD_RE.findall(expected_lower))
+
+    return _synonym_overlap_score(predicted_lower, predicted_words, expected_words)
+
 
+def _synonym_overlap_score(predicted_lower: str, predicted_words: set, expected_words: set) -> float:
+    """Word overlap plus fashion-synonym credit over pre-tokenized word sets."""
     # Calculate base overlap
     direct_overlap = predicted_words & expected_words
-    base_score = len(direct_overlap) / len(expected_words) if expected_words else 0.0
+    expected_word_count = len(expected_words)
+    base_score = len(direct_overlap) / expected_word_count if expected_words else 0.0
+
+    # Every expected word matched directly, so there is nothing left for synonyms to credit
+    if base_score >= 1.0:
+        return base_score * 0.7
 
     # Check for synonym matches
     synonym_matches = 0
-    expected_word_count = len(expected_words)
+
+    group_hits = {}  # group index -> whether any of its terms appears in predicted
 
     for exp_word in expected_words:
         if exp_word in predicted_words:
             continue  # Already counted in direct overlap
 
-        # Check if any synonym of exp_word is in predicted
-        for key, synonyms in fashion_synonyms.items():
-            if exp_word == key or exp_word in synonyms:
-                # Check if any synonym appears in predicted
-                if any(syn in predicted_lower for syn in [key] + synonyms):
-                    synonym_matches += 1
-                    break
+        group = _SYNONYM_GROUP.get(exp_word)
+        if group is None:
+            continue
+
+        # Check if any synonym of exp_word appears in predicted (once per group)
+        if group not in group_hits:
+            group_hits[group] = any(term in predicted_lower for term in _GROUP_TERMS[group])
+        if group_hits[group]:
+            synonym_matches += 1
 
     synonym_score = synonym_matches / expected_word_count if expected_word_count > 0 else 0.0
 
@@ -142,6 +174,39 @@ def fashion_similarity(predicted: str, expected: str) -> float:
     return min(final_score, 1.0)
 
 
+@lru_cache(maxsize=_PAIR_CACHE_SIZE)
+def blended_similarity(predicted: str, expected: str) -> float:
+    """
+    Average of partial_match and fashion_similarity, tokenizing the pair once.
+
+    Args:
+        predicted: Model's predicted output
+        expected: Expected correct output
+
+    Returns:
+        Score between 0.0 and 1.0
+    """
+    if not predicted or not expected:
+        return 0.0
+
+    predicted_lower = predicted.lower()
+    expected_lower = expected.lower()
+    predicted_words = set(_WORD_RE.findall(predicted_lower))
+    expected_words = set(_WORD_RE.findall(expected_lower))
+
+    partial_score = _word_overlap_score(predicted_words, expected_words)
+
+    # Same early exits as fashion_similarity
+    if predicted_lower == expected_lower:
+        similarity_score = 1.0
+    elif expected_lower in predicted_lower or predicted_lower in expected_lower:
+        similarity_score = 0.9
+    else:
+        similarity_score = _synonym_overlap_score(predicted_lower, predicted_words, expected_words)
+
+    return (partial_score + similarity_score) / 2
+
+
 def list_overlap_score(predicted: List[str], expected: List[str]) -> float:
     """
     Calculate overlap score between two lists.
@@ -159,8 +224,8 @@ def list_overlap_score(predicted: List[str], expected: List[str]) -> float:
     if not predicted:
         return 0.0
 
-    predicted_set = set(item.lower().strip() for item in predicted)
-    expected_set = set(item.lower().strip() for item in expected)
+    predicted_set = {item.lower().strip() for item in predicted}
+    expected_set = {item.lower().strip() for item in expected}
 
     intersection = predicted_set & expected_set
     precision = len(intersection) / len(predicted_set) if predicted_set else 0.0
@@ -174,12 +239,12 @@ def list_overlap_score(predicted: List[str], expected: List[str]) -> float:
     return f1
 
 
-def calculate_accuracy(results: List[dict], threshold: float = 0.7) -> dict:
+def calculate_accuracy(results: List[Any], threshold: float = 0.7) -> dict:
     """
     Calculate overall accuracy metrics from a list of evaluation results.
 
     Args:
-        results: List of result dictionaries with 'score' field
+        results: List of result dictionaries or EvalRecords with a 'score' field
         threshold: Threshold for considering a result as correct
 
     Returns:
@@ -194,8 +259,9 @@ def calculate_accuracy(results: List[dict], threshold: float = 0.7) -> dict:
         }
 
     total = len(results)
-    passed = sum(1 for r in results if r.get("score", 0) >= threshold)
-    avg_score = sum(r.get("score", 0) for r in results) / total
+    scores = [r.get("score", 0) if isinstance(r, dict) else r.score for r in results]
+    passed = sum(1 for score in scores if score >= threshold)
+    avg_score = sum(scores) / total
 
     return {
         "total": total,
@@ -235,6 +301,7 @@ __all__ = [
     'exact_match',
     'partial_match',
     'fashion_similarity',
+    'blended_similarity',
     'list_overlap_score',
     'calculate_accuracy',
     'weighted_score'